@@ -4,6 +4,27 @@ import copy
 from constants import ROWS, COLS, EMPTY, PLAYER, AI, DEPTH
 from board import get_valid_locations, is_terminal_node, check_winner, get_next_open_row, drop_piece
 
+# score for a won/lost position
+WIN_SCORE = 100000000
+
+# half-width of the aspiration window around the previous iteration's score
+ASPIRATION_WINDOW = 50
+
+# max entries kept in search_cache before it is cleared
+CACHE_SIZE = 100000
+
+# best AI move per (position, depth), shared with the ponder thread
+search_cache = {}
+
+
+class SearchAborted(Exception):
+    """Raised from an on_node callback to abandon a search."""
+
+
+def board_key(board):
+    """Hashable key for a board position."""
+    return tuple(tuple(row) for row in board)
+
 def evaluate_window(window, piece):
     """Evaluate a window of 4 cells."""
     score = 0
@@ -63,22 +84,26 @@ def score_position(board, piece):
     return score
 
 
-def minimax(board, depth, alpha, beta, maximizing_player):
+def minimax(board, depth, alpha, beta, maximizing_player, stats=None):
     """
     Minimax algorithm with alpha-beta pruning.
+    Kept as the full-window reference search for benchmark.py.
     
     Returns:
         (column, score) tuple
     """
+    if stats is not None:
+        stats["nodes"] += 1
+
     valid_locations = get_valid_locations(board)
     is_terminal = is_terminal_node(board)
     
     if depth == 0 or is_terminal:
         if is_terminal:
             if check_winner(board, AI):
-                return (None, 100000000)
+                return (None, WIN_SCORE)
             elif check_winner(board, PLAYER):
-                return (None, -100000000)
+                return (None, -WIN_SCORE)
             else:
                 return (None, 0)
         else:
@@ -92,7 +117,7 @@ def minimax(board, depth, alpha, beta, maximizing_player):
             row = get_next_open_row(board, col)
             temp_board = copy.deepcopy(board)
             drop_piece(temp_board, row, col, AI)
-            new_score = minimax(temp_board, depth - 1, alpha, beta, False)[1]
+            new_score = minimax(temp_board, depth - 1, alpha, beta, False, stats)[1]
             
             if new_score > value:
                 value = new_score
@@ -112,7 +137,7 @@ def minimax(board, depth, alpha, beta, maximizing_player):
             row = get_next_open_row(board, col)
             temp_board = copy.deepcopy(board)
             drop_piece(temp_board, row, col, PLAYER)
-            new_score = minimax(temp_board, depth - 1, alpha, beta, True)[1]
+            new_score = minimax(temp_board, depth - 1, alpha, beta, True, stats)[1]
             
             if new_score < value:
                 value = new_score
@@ -125,13 +150,193 @@ def minimax(board, depth, alpha, beta, maximizing_player):
         return best_col, value
 
 
+def order_moves(valid_locations, first_col=None, history=None):
+    """
+    Order columns center-first, with first_col (best move so far) tried first.
+    If history is given (column -> score), higher-scoring columns go before
+    the center-first order.
+    """
+    if history is None:
+        ordered = sorted(valid_locations, key=lambda col: abs(col - COLS // 2))
+    else:
+        ordered = sorted(valid_locations, key=lambda col: (-history.get(col, 0), abs(col - COLS // 2)))
+    if first_col in ordered:
+        ordered.remove(first_col)
+        ordered.insert(0, first_col)
+    return ordered
+
+
+def leaf_score(board, piece):
+    """Score a terminal or depth-limit position from the point of view of piece."""
+    opponent = PLAYER if piece == AI else AI
+
+    if check_winner(board, piece):
+        return WIN_SCORE
+    elif check_winner(board, opponent):
+        return -WIN_SCORE
+    elif len(get_valid_locations(board)) == 0:
+        return 0
+    else:
+        # score_position is from the AI's side, flip it for the player
+        score = score_position(board, AI)
+        return score if piece == AI else -score
+
+
+def negamax(board, depth, alpha, beta, piece, stats=None):
+    """
+    Full-window alpha-beta in negamax form with the same move ordering as pvs.
+    Kept as a reference search for benchmark.py, so the gain from move
+    ordering can be told apart from the gain from PVS itself.
+    
+    Returns:
+        (column, score) tuple, score from the point of view of piece
+    """
+    if stats is not None:
+        stats["nodes"] += 1
+
+    opponent = PLAYER if piece == AI else AI
+
+    if depth == 0 or is_terminal_node(board):
+        return (None, leaf_score(board, piece))
+
+    value = -math.inf
+    best_col = None
+
+    for col in order_moves(get_valid_locations(board)):
+        row = get_next_open_row(board, col)
+        temp_board = copy.deepcopy(board)
+        drop_piece(temp_board, row, col, piece)
+        new_score = -negamax(temp_board, depth - 1, -beta, -alpha, opponent, stats)[1]
+
+        if new_score > value:
+            value = new_score
+            best_col = col
+
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            break
+
+    return best_col, value
+
+
+def pvs(board, depth, alpha, beta, piece, stats=None, best_moves=None, on_node=None, history=None):
+    """
+    Principal variation search (negamax form).
+    The first move is searched with the full window, the rest with a null
+    window and re-searched only if they land inside (alpha, beta).
+    best_moves maps board_key to the best column found for that position so
+    far; it is tried first and updated, so iterative deepening can reuse it.
+    history maps piece to {column: score} for moves that caused cutoffs, and
+    orders the remaining moves.
+    on_node is called once per node and may raise SearchAborted.
+    
+    Returns:
+        (column, score) tuple, score from the point of view of piece
+    """
+    if stats is not None:
+        stats["nodes"] += 1
+    if on_node is not None:
+        on_node()
+
+    opponent = PLAYER if piece == AI else AI
+
+    if depth == 0 or is_terminal_node(board):
+        return (None, leaf_score(board, piece))
+
+    value = -math.inf
+    best_col = None
+
+    key = board_key(board) if best_moves is not None else None
+    first_col = best_moves.get(key) if best_moves is not None else None
+
+    piece_history = history.setdefault(piece, {}) if history is not None else None
+
+    for i, col in enumerate(order_moves(get_valid_locations(board), first_col, piece_history)):
+        row = get_next_open_row(board, col)
+        temp_board = copy.deepcopy(board)
+        drop_piece(temp_board, row, col, piece)
+
+        if i == 0:
+            new_score = -pvs(temp_board, depth - 1, -beta, -alpha, opponent, stats, best_moves, on_node, history)[1]
+        else:
+            new_score = -pvs(temp_board, depth - 1, -alpha - 1, -alpha, opponent, stats, best_moves, on_node, history)[1]
+            # a leaf child already returned its exact score, no need to re-search it
+            if depth > 1 and alpha < new_score < beta:
+                new_score = -pvs(temp_board, depth - 1, -beta, -new_score, opponent, stats, best_moves, on_node, history)[1]
+
+        if new_score > value:
+            value = new_score
+            best_col = col
+
+        alpha = max(alpha, value)
+        if alpha >= beta:
+            if piece_history is not None:
+                piece_history[col] = piece_history.get(col, 0) + depth * depth
+            break
+
+    if best_moves is not None:
+        best_moves[key] = best_col
+
+    return best_col, value
+
+
+def search(board, depth, stats=None, on_node=None):
+    """
+    Iterative deepening PVS from the AI's side.
+    Deeper searches first run a pass two plies shallower (depth 5 runs 3, then 5),
+    since the heuristic swings between odd and even depths and more shallow
+    passes cost more than they save; depth 3 and below is a single pass.
+    The second pass starts with an aspiration window around the first score
+    and falls back to a full window if it fails. Best moves and the history
+    table from the first pass order the moves of the second.
+    
+    Returns:
+        (column, score) tuple
+    """
+    col, score = None, None
+    best_moves = {}
+    history = {}
+
+    depths = [depth - 2, depth] if depth > 3 else [depth]
+
+    for current_depth in depths:
+        if score is None or abs(score) >= WIN_SCORE:
+            alpha, beta = -math.inf, math.inf
+        else:
+            alpha, beta = score - ASPIRATION_WINDOW, score + ASPIRATION_WINDOW
+
+        new_col, new_score = pvs(board, current_depth, alpha, beta, AI, stats, best_moves, on_node, history)
+        if new_score <= alpha or new_score >= beta:
+            new_col, new_score = pvs(board, current_depth, -math.inf, math.inf, AI, stats, best_moves, on_node, history)
+
+        col, score = new_col, new_score
+
+        # game already over at the root, deeper iterations won't change anything
+        if col is None:
+            break
+
+    return col, score
+
+
 def get_ai_move(board, depth=None):
-    """Get the AI's move using minimax.
+    """Get the AI's move using principal variation search.
     If depth is None, use the global DEPTH from constants (which is medium level)
+    Results are cached in search_cache, which the ponder thread also fills.
     """
     if depth is None:
         depth = DEPTH
 
-    col, _ = minimax(board, depth, -math.inf, math.inf, True)
+    key = (board_key(board), depth)
+    if key in search_cache:
+        return search_cache[key]
+
+    col, _ = search(board, depth)
+    store_move(key, col)
     return col
 
+
+def store_move(key, col):
+    """Save a searched move in search_cache."""
+    if len(search_cache) >= CACHE_SIZE:
+        search_cache.clear()
+    search_cache[key] = col
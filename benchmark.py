@@ -0,0 +1,149 @@
+import math
+import random
+import statistics
+import sys
+import time
+from constants import PLAYER, AI, EASY_DEPTH, MEDIUM_DEPTH, HARD_DEPTH
+from board import create_board, get_next_open_row, drop_piece, get_valid_locations, is_terminal_node
+from ai import minimax, negamax, search
+
+# standard position set: columns played in order (0-indexed), player moves first
+POSITIONS = {
+    "empty board": [],
+    "center opening": [3, 3],
+    "early middle game": [3, 3, 2, 4, 4, 2],
+    "player threat": [3, 2, 4, 3, 5],
+    "ai threat": [0, 3, 1, 3, 6, 3],
+    "crowded center": [3, 3, 3, 2, 4, 4, 2, 3, 2, 4],
+    "late game": [3, 3, 2, 4, 4, 2, 1, 5, 5, 1, 6, 0, 0, 6, 3],
+}
+
+
+def build_position(moves):
+    """Play a move sequence from an empty board, alternating player/AI."""
+    board = create_board()
+    piece = PLAYER
+    for col in moves:
+        row = get_next_open_row(board, col)
+        drop_piece(board, row, col, piece)
+        piece = AI if piece == PLAYER else PLAYER
+    return board
+
+
+def random_positions(count, seed=1, max_moves=20):
+    """Seeded random non-terminal positions, for a bigger per-position sample."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        moves = []
+        board = create_board()
+        for _ in range(rng.randint(0, max_moves)):
+            moves.append(rng.choice(get_valid_locations(board)))
+            board = build_position(moves)
+            if is_terminal_node(board):
+                break
+        if not is_terminal_node(board):
+            positions.append(board)
+    return positions
+
+
+def compare_random(count=60, depths=(MEDIUM_DEPTH, HARD_DEPTH)):
+    """
+    Count per position how often PVS search beats ordered alpha-beta on
+    random positions. Returns False if the scores ever disagree.
+    """
+    positions = random_positions(count)
+    scores_match = True
+
+    print(f"\n=== {count} random positions, PVS vs ordered alpha-beta ===")
+    for depth in depths:
+        savings = []
+        for board in positions:
+            ordered_stats = {"nodes": 0}
+            _, ordered_score = negamax(board, depth, -math.inf, math.inf, AI, ordered_stats)
+            pvs_stats = {"nodes": 0}
+            _, pvs_score = search(board, depth, pvs_stats)
+
+            if ordered_score != pvs_score:
+                print(f"  score mismatch: ordered {ordered_score}, pvs {pvs_score}")
+                scores_match = False
+            savings.append(1 - pvs_stats["nodes"] / ordered_stats["nodes"])
+
+        won = sum(1 for saved in savings if saved > 0)
+        lost = sum(1 for saved in savings if saved < 0)
+        print(f"Depth {depth}: {won} won, {lost} lost, {len(savings) - won - lost} tied, "
+              f"median {statistics.median(savings):.1%} fewer nodes")
+    return scores_match
+
+
+def run_benchmark(depths=(EASY_DEPTH, MEDIUM_DEPTH, HARD_DEPTH)):
+    """
+    Compare node counts of plain alpha-beta, alpha-beta with PVS's move
+    ordering, and PVS on each position.
+    Returns False if the searches disagree on the score of any position.
+    """
+    totals = {"alpha-beta": 0, "ordered": 0, "pvs": 0}
+    # per-position share of nodes PVS saves over ordered alpha-beta, so one
+    # outlier can't carry the total
+    savings = []
+    scores_match = True
+
+    for depth in depths:
+        print(f"\n=== Depth {depth} ===")
+        print(f"{'position':<20}{'alpha-beta':>12}{'ordered':>10}{'pvs':>8}"
+              f"{'vs ab':>9}{'vs ordered':>12}{'time ab/ord/pvs':>22}")
+
+        for name, moves in POSITIONS.items():
+            board = build_position(moves)
+
+            ab_stats = {"nodes": 0}
+            start = time.perf_counter()
+            _, ab_score = minimax(board, depth, -math.inf, math.inf, True, ab_stats)
+            ab_time = time.perf_counter() - start
+
+            ordered_stats = {"nodes": 0}
+            start = time.perf_counter()
+            _, ordered_score = negamax(board, depth, -math.inf, math.inf, AI, ordered_stats)
+            ordered_time = time.perf_counter() - start
+
+            pvs_stats = {"nodes": 0}
+            start = time.perf_counter()
+            _, pvs_score = search(board, depth, pvs_stats)
+            pvs_time = time.perf_counter() - start
+
+            # all searches must agree on the value of the position
+            if not ab_score == ordered_score == pvs_score:
+                print(f"  score mismatch on {name}: alpha-beta {ab_score}, "
+                      f"ordered {ordered_score}, pvs {pvs_score}")
+                scores_match = False
+
+            saved_ab = 1 - pvs_stats["nodes"] / ab_stats["nodes"]
+            saved_ordered = 1 - pvs_stats["nodes"] / ordered_stats["nodes"]
+            print(f"{name:<20}{ab_stats['nodes']:>12}{ordered_stats['nodes']:>10}{pvs_stats['nodes']:>8}"
+                  f"{saved_ab:>9.1%}{saved_ordered:>12.1%}"
+                  f"{ab_time:>10.3f}/{ordered_time:.3f}/{pvs_time:.3f}s")
+
+            savings.append(saved_ordered)
+            totals["alpha-beta"] += ab_stats["nodes"]
+            totals["ordered"] += ordered_stats["nodes"]
+            totals["pvs"] += pvs_stats["nodes"]
+
+    ordering_saved = 1 - totals["ordered"] / totals["alpha-beta"]
+    pvs_saved = 1 - totals["pvs"] / totals["ordered"]
+    total_saved = 1 - totals["pvs"] / totals["alpha-beta"]
+    print(f"\nTotal nodes: alpha-beta {totals['alpha-beta']}, ordered {totals['ordered']}, pvs {totals['pvs']}")
+    print(f"Move ordering saves {ordering_saved:.1%}, PVS search saves another "
+          f"{pvs_saved:.1%} in total ({total_saved:.1%} fewer overall)")
+
+    won = sum(1 for saved in savings if saved > 0)
+    lost = sum(1 for saved in savings if saved < 0)
+    print(f"PVS vs ordered alpha-beta per position: {won} won, {lost} lost, "
+          f"{len(savings) - won - lost} tied, median {statistics.median(savings):.1%} fewer nodes")
+    return scores_match
+
+
+if __name__ == "__main__":
+    scores_match = run_benchmark()
+    scores_match = compare_random() and scores_match
+    if not scores_match:
+        sys.exit(1)
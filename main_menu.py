@@ -1,3 +1,4 @@
+import time
 import pygame
 from ui import run_ui
 from constants import EASY_DEPTH, MEDIUM_DEPTH, HARD_DEPTH
@@ -35,7 +36,14 @@ def draw_button(text, x, y, width, height, hovered, border_radius, screen):
     draw_text(text, font, BLACK, x + (width - font.size(text)[0]) // 2, y + (height - font.size(text)[1]) // 2, screen)
 
 # Main game loop
-def main_menu():
+# get_events, get_mouse_pos, frame_stats and ponder are passed on to run_ui
+# (see ui.run_ui); menu frame times go in frame_stats["menu_frame"]
+def main_menu(get_events=None, frame_stats=None, ponder=True, get_mouse_pos=None):
+    if get_events is None:
+        get_events = pygame.event.get
+    if get_mouse_pos is None:
+        get_mouse_pos = pygame.mouse.get_pos
+
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Connect 4")
     
@@ -45,7 +53,7 @@ def main_menu():
         screen.fill(BLUE_BG)
 
         # Get mouse position
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = get_mouse_pos()
 
         # Button positions and sizes (center the buttons horizontally)
         button_positions = [
@@ -56,33 +64,37 @@ def main_menu():
         ]
 
         # Check for events
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
                 pygame.quit()
                 return
 
             if event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_x, mouse_y = event.pos
                 # Check which button is clicked
                 for (x, y, text) in button_positions:
                     if x <= mouse_x <= x + button_width and y <= mouse_y <= y + button_height:
                         if text == "EASY":
                             print("Starting Easy mode...")
-                            run_ui(EASY_DEPTH, "Easy")
+                            run_ui(EASY_DEPTH, "Easy", ponder=ponder, get_events=get_events,
+                                   get_mouse_pos=get_mouse_pos, frame_stats=frame_stats)
                             # When run_ui returns, recreate the screen for menu
                             print("Returned from Easy mode, reloading menu...")
                             screen = pygame.display.set_mode((WIDTH, HEIGHT))
                             pygame.display.set_caption("Connect 4")
                         elif text == "MEDIUM":
                             print("Starting Medium mode...")
-                            run_ui(MEDIUM_DEPTH, "Medium")
+                            run_ui(MEDIUM_DEPTH, "Medium", ponder=ponder, get_events=get_events,
+                                   get_mouse_pos=get_mouse_pos, frame_stats=frame_stats)
                             # When run_ui returns, recreate the screen for menu
                             print("Returned from Medium mode, reloading menu...")
                             screen = pygame.display.set_mode((WIDTH, HEIGHT))
                             pygame.display.set_caption("Connect 4")
                         elif text == "HARD":
                             print("Starting Hard mode...")
-                            run_ui(HARD_DEPTH, "Hard")
+                            run_ui(HARD_DEPTH, "Hard", ponder=ponder, get_events=get_events,
+                                   get_mouse_pos=get_mouse_pos, frame_stats=frame_stats)
                             # When run_ui returns, recreate the screen for menu
                             print("Returned from Hard mode, reloading menu...")
                             screen = pygame.display.set_mode((WIDTH, HEIGHT))
@@ -92,6 +104,9 @@ def main_menu():
                             pygame.quit()
                             return
 
+        # menu frame time is measured from here, so time spent in run_ui is left out
+        frame_start = time.perf_counter()
+
         # Draw title at the top of the screen
         draw_text("Connect 4", title_font, (255, 255, 255), (WIDTH - title_font.size("Connect 4")[0]) // 2, 40, screen)
 
@@ -103,6 +118,9 @@ def main_menu():
         # Update display
         pygame.display.flip()
 
+        if frame_stats is not None:
+            frame_stats["menu_frame"].append(time.perf_counter() - frame_start)
+
 # Main function to start the menu
 if __name__ == "__main__":
     main_menu()
\ No newline at end of file
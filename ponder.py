@@ -0,0 +1,183 @@
+import copy
+import math
+import threading
+import time
+from constants import PLAYER, AI
+from board import get_valid_locations, get_next_open_row, drop_piece, check_winner
+from ai import SearchAborted, board_key, pvs, search, store_move, search_cache, get_ai_move
+
+# share of one CPU the ponder thread may use, the rest is left to the render loop
+PONDER_DUTY_CYCLE = 0.5
+
+# how long the ponder thread runs before it sleeps (seconds)
+PONDER_SLICE = 0.005
+
+# how long it sleeps after each slice (seconds), from the duty cycle
+PONDER_PAUSE = PONDER_SLICE * (1 - PONDER_DUTY_CYCLE) / PONDER_DUTY_CYCLE
+
+# nodes between time checks in the throttle
+PONDER_CHECK_NODES = 16
+
+
+class Ponderer:
+    """
+    Searches the AI's answers to the player's likely replies in a
+    background thread while the player is thinking.
+    Results go into ai.search_cache, so get_ai_move picks them up.
+    """
+
+    def __init__(self):
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.hurry_event = threading.Event()   # set when nobody should wait on the throttle
+        self.keep_key = None      # position still worth finishing after stop()
+        self.current_key = None   # position the thread is searching right now
+        self.compute_times = {}   # (position, depth) -> ponder compute time
+
+        # throttle state
+        self._slice_start = 0.0
+        self._nodes = 0
+        self._slept = 0.0
+
+        # stats
+        self.hits = 0           # answered from a position pondered this turn
+        self.cache_reuses = 0   # answered from search_cache, but not pondered this turn
+        self.misses = 0
+        self.latency_saved = 0.0
+
+    def start(self, board, depth):
+        """Start pondering the player's replies to this position."""
+        self.stop()
+        self.join()
+
+        self.stop_event.clear()
+        self.hurry_event.clear()
+        self.keep_key = None
+        self.thread = threading.Thread(
+            target=self._run, args=(copy.deepcopy(board), depth), daemon=True
+        )
+        self.thread.start()
+
+    def stop(self, board=None):
+        """
+        Tell the thread to stop without waiting for it.
+        If board is given and is being searched right now, that search is
+        allowed to finish (still throttled) and everything else is dropped.
+        """
+        self.keep_key = board_key(board) if board is not None else None
+        self.stop_event.set()
+        if board is None:
+            # nothing left worth finishing, cut any pause short
+            self.hurry_event.set()
+
+    def join(self):
+        """Wait for the thread to exit."""
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def get_move(self, board, depth):
+        """Get the AI's move, using the pondered result when there is one."""
+        start = time.perf_counter()
+        self.stop(board)
+        # the frame is blocked on us now, finish the kept search at full speed
+        self.hurry_event.set()
+        self.join()
+
+        # a hit is a position pondered this turn; anything else already in
+        # search_cache (e.g. from an earlier game) is plain cache reuse
+        key = (board_key(board), depth)
+        pondered = key in self.compute_times
+        cached = key in search_cache
+        col = get_ai_move(board, depth)
+        waited = time.perf_counter() - start
+
+        if pondered:
+            self.hits += 1
+            self.latency_saved += max(0.0, self.compute_times[key] - waited)
+        elif cached:
+            self.cache_reuses += 1
+        else:
+            self.misses += 1
+
+        self.compute_times.clear()
+        return col
+
+    def hit_rate(self):
+        """Share of AI moves answered by pondering this turn."""
+        total = self.hits + self.cache_reuses + self.misses
+        return self.hits / total if total else 0.0
+
+    def print_stats(self):
+        """Print ponder hit rate, cache reuse and latency saved."""
+        total = self.hits + self.cache_reuses + self.misses
+        if total == 0:
+            return
+        print(f"Ponder: {self.hits}/{total} hits ({self.hit_rate():.0%}), "
+              f"{self.cache_reuses} cache reuses, {self.latency_saved:.4f} seconds saved")
+
+    def _likely_replies(self, board):
+        """Player replies, most likely first (best for the player by a shallow search)."""
+        replies = []
+        for col in get_valid_locations(board):
+            row = get_next_open_row(board, col)
+            temp_board = copy.deepcopy(board)
+            drop_piece(temp_board, row, col, PLAYER)
+            score = pvs(temp_board, 1, -math.inf, math.inf, AI, on_node=self._throttle)[1]
+            replies.append((score, col, temp_board))
+
+        # lower AI score means a better reply for the player
+        replies.sort(key=lambda reply: reply[0])
+        return [temp_board for _, _, temp_board in replies]
+
+    def _run(self, board, depth):
+        self._slice_start = time.perf_counter()
+        self._nodes = 0
+        self._slept = 0.0
+
+        try:
+            for temp_board in self._likely_replies(board):
+                if self.stop_event.is_set():
+                    break
+                # no AI move needed if the reply ends the game
+                if check_winner(temp_board, PLAYER) or len(get_valid_locations(temp_board)) == 0:
+                    continue
+
+                key = (board_key(temp_board), depth)
+                if key in search_cache:
+                    continue
+
+                self.current_key = key[0]
+                start = time.perf_counter()
+                self._slept = 0.0
+                col, _ = search(temp_board, depth, on_node=self._throttle)
+                self.compute_times[key] = time.perf_counter() - start - self._slept
+                store_move(key, col)
+        except SearchAborted:
+            pass
+        finally:
+            self.current_key = None
+
+    def _throttle(self):
+        """on_node callback: abort when stopped, sleep to respect the duty cycle."""
+        self._nodes += 1
+        if self._nodes % PONDER_CHECK_NODES:
+            return
+
+        self._check_stop()
+        if self.hurry_event.is_set():
+            return
+
+        if time.perf_counter() - self._slice_start >= PONDER_SLICE:
+            # a fixed pause, and one that stop()/get_move() can cut short
+            pause_start = time.perf_counter()
+            self.hurry_event.wait(PONDER_PAUSE)
+            self._slept += time.perf_counter() - pause_start
+            self._slice_start = time.perf_counter()
+            self._check_stop()
+
+    def _check_stop(self):
+        """Abort unless the thread is still wanted or is on the position to keep."""
+        if self.stop_event.is_set():
+            if self.current_key is None or self.current_key != self.keep_key:
+                raise SearchAborted()
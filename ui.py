@@ -10,6 +10,7 @@ from board import (
     get_valid_locations,
 )
 from ai import get_ai_move
+from ponder import Ponderer
 
 # visual settings
 SQUARESIZE = 80
@@ -31,6 +32,12 @@ AI_COLOR = (253, 213, 71)      # AI (yellow)
 TEXT_COLOR = (26, 104, 208)
 WINNER_TEXT_COLOR = (0, 0, 0)
 
+# AI thinking delay (UI pause)
+AI_DELAY_MS = 800
+
+# how long the result stays on screen before a new game starts
+RESULT_DELAY_MS = 3000
+
 # Return to menu button colors
 MENU_BUTTON_BG = (237, 67, 62)  # Red
 MENU_BUTTON_HOVER = (200, 50, 50)  # Darker red
@@ -75,8 +82,20 @@ def draw_board(screen, board):
             )
 
 
-def run_ui(initial_depth=None, initial_difficulty_name=None):
-    """Pygame UI for Connect 4 with continuous gameplay loop."""
+def run_ui(initial_depth=None, initial_difficulty_name=None, ponder=True,
+           get_events=None, frame_stats=None, get_mouse_pos=None):
+    """Pygame UI for Connect 4 with continuous gameplay loop.
+    With ponder on, the AI searches the player's likely replies in the background
+    while the player is thinking.
+    get_events and get_mouse_pos replace pygame.event.get and
+    pygame.mouse.get_pos (used to replay scripted games), and
+    frame_stats, if given, is a dict of lists that collects per-frame timings
+    ("frame", "render", "draw_board", "ai_stall").
+    """
+    if get_events is None:
+        get_events = pygame.event.get
+    if get_mouse_pos is None:
+        get_mouse_pos = pygame.mouse.get_pos
     
     # Set initial difficulty from menu or default to Medium
     if initial_depth is not None and initial_difficulty_name is not None:
@@ -96,9 +115,6 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
     font = pygame.font.SysFont("arial", 36, bold=True)   # winner text
     small_font = pygame.font.SysFont("arial", 20)        # instruction text
 
-    # AI thinking delay (UI pause)
-    AI_DELAY_MS = 800
-
     # move/compute times for each AI difficulty level
     move_times = {
         "Easy": [],
@@ -106,6 +122,9 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
         "Hard": [],
     }
 
+    # background search during the player's turn
+    ponderer = Ponderer() if ponder else None
+
     clock = pygame.time.Clock()
     running = True
     return_to_menu = False  # Flag to break continuous loop
@@ -134,8 +153,10 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
 
         # Individual game loop
         while running and not game_over:
+            frame_start = time.perf_counter()
+
             # ----- EVENT HANDLING -----
-            for event in pygame.event.get():
+            for event in get_events():
                 if event.type == pygame.QUIT:
                     running = False
                     break
@@ -158,6 +179,11 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                         pygame.display.set_caption(f"Connect 4 Game - {difficulty_name} Mode")
                         print("Difficulty is set to hard (depth=", current_depth, ")")
 
+                    # pondered results are per depth, so restart at the new one
+                    if ponderer is not None and not game_over and turn == PLAYER:
+                        if event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
+                            ponderer.start(board, current_depth)
+
                 # hover column for players turn
                 if event.type == pygame.MOUSEMOTION:
                     if not game_over and turn == PLAYER:
@@ -189,6 +215,10 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                                 row = get_next_open_row(board, col)
                                 drop_piece(board, row, col, PLAYER)
 
+                                # keep only the pondered search for this position
+                                if ponderer is not None:
+                                    ponderer.stop(board)
+
                                 if check_winner(board, PLAYER):
                                     print("Player WINS!")
                                     status_text = "Player WINS!"
@@ -215,12 +245,17 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                         if len(valid_locations) > 0:
                             # measure compute time of minimax
                             start = time.perf_counter()
-                            col = get_ai_move(board, current_depth)
+                            if ponderer is not None:
+                                col = ponderer.get_move(board, current_depth)
+                            else:
+                                col = get_ai_move(board, current_depth)
                             end = time.perf_counter()
                             elapsed = end - start
 
                             if difficulty_name in move_times:
                                 move_times[difficulty_name].append(elapsed)
+                            if frame_stats is not None:
+                                frame_stats["ai_stall"].append(elapsed)
                             print(f"[{difficulty_name}] AI move took {elapsed:.4f} seconds")
 
                             if col is not None and is_valid_location(board, col):
@@ -238,17 +273,24 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                                         game_over = True
                                     else:
                                         turn = PLAYER
+                                        if ponderer is not None:
+                                            ponderer.start(board, current_depth)
                 else:
                     # safety net if somehow ai_thinking is False but it's AI's turn
                     valid_locations = get_valid_locations(board)
                     if len(valid_locations) > 0:
                         start = time.perf_counter()
-                        col = get_ai_move(board, current_depth)
+                        if ponderer is not None:
+                            col = ponderer.get_move(board, current_depth)
+                        else:
+                            col = get_ai_move(board, current_depth)
                         end = time.perf_counter()
                         elapsed = end - start
 
                         if difficulty_name in move_times:
                             move_times[difficulty_name].append(elapsed)
+                        if frame_stats is not None:
+                            frame_stats["ai_stall"].append(elapsed)
                         print(f"[{difficulty_name}] AI move took {elapsed:.4f} seconds")
 
                         if col is not None and is_valid_location(board, col):
@@ -262,8 +304,11 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                                 game_over = True
                             else:
                                 turn = PLAYER
+                                if ponderer is not None:
+                                    ponderer.start(board, current_depth)
 
             # ----- RENDERING -----
+            render_start = time.perf_counter()
             screen.fill(BG_COLOR)
 
             # hover piece
@@ -279,7 +324,10 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                 )
 
             # board
+            draw_start = time.perf_counter()
             draw_board(screen, board)
+            if frame_stats is not None:
+                frame_stats["draw_board"].append(time.perf_counter() - draw_start)
 
             # Display difficulty mode at top left (away from menu button)
             mode_text = small_font.render(f"Difficulty: {difficulty_name}", True, TEXT_COLOR)
@@ -299,10 +347,12 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
                     if times:
                         avg = sum(times) / len(times)
                         print(f"{diff}: {len(times)} moves, average {avg:.4f} seconds per move")
+                if ponderer is not None:
+                    ponderer.print_stats()
                 stats_printed = True
 
             # Draw return to menu button LAST so it's on top
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = get_mouse_pos()
             menu_button_hovered = menu_button_rect.collidepoint(mouse_pos)
             button_color = MENU_BUTTON_HOVER if menu_button_hovered else MENU_BUTTON_BG
             pygame.draw.rect(screen, button_color, menu_button_rect, border_radius=8)
@@ -311,14 +361,25 @@ def run_ui(initial_depth=None, initial_difficulty_name=None):
             screen.blit(menu_text, menu_text_rect)
 
             pygame.display.flip()
+
+            if frame_stats is not None:
+                frame_end = time.perf_counter()
+                frame_stats["render"].append(frame_end - render_start)
+                frame_stats["frame"].append(frame_end - frame_start)
+
             clock.tick(60)
 
         # Game over - wait for a moment then start new game
         if running and game_over and not return_to_menu:
             # Show result for 3 seconds
-            pygame.time.wait(3000)
+            pygame.time.wait(RESULT_DELAY_MS)
             print("\n--- Starting new game ---\n")
 
+    # Stop pondering before leaving
+    if ponderer is not None:
+        ponderer.stop()
+        ponderer.join()
+
     # Clear event queue before returning to menu
     pygame.event.clear()
     print("Exiting run_ui, returning to main menu...")
@@ -0,0 +1,217 @@
+import os
+
+# headless: SDL's dummy drivers need no display or sound card (set before pygame loads)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import contextlib
+import io
+import math
+import sys
+import pygame
+import ui
+import main_menu as menu
+from constants import PLAYER, AI, EASY_DEPTH, MEDIUM_DEPTH, HARD_DEPTH
+from board import create_board, is_valid_location, get_next_open_row, drop_piece, check_winner, get_valid_locations
+import ai
+
+# recorded games, played one after another in the same run_ui session
+# ints are the player's clicked columns (0-indexed), strings are difficulty key presses
+# the session starts on Medium (picked in the menu)
+GAMES = [
+    [6, 2, 0, 3, 2, 2, 0, 0, 2, 0, 6, 6, 1, 1, 5, 4],
+    ["easy", 6, 2, 0, 3, 2, 3, 0, 0, 0],
+    ["hard", 4, 4, 3, 4, 3, 2, 2, 5, 5, 5, 0, 0, 0, 2, 1, 1, 6, 1, 6, 2],
+    [3, 2, 0, 3, 6, 4, 2, 2, 3, 6, 4],
+]
+
+DIFFICULTY_KEYS = {
+    "easy": (pygame.K_1, EASY_DEPTH),
+    "medium": (pygame.K_2, MEDIUM_DEPTH),
+    "hard": (pygame.K_3, HARD_DEPTH),
+}
+
+# frames spent moving the mouse before each click (the player "thinking")
+IDLE_FRAMES = 10
+
+# frames spent on the main menu before and after the games
+MENU_FRAMES = 30
+
+# one frame at 60 FPS (seconds)
+FRAME_BUDGET = 1 / 60
+
+
+class ScriptedEvents:
+    """
+    Stands in for pygame.event.get, returning one scripted frame of events per call.
+    mouse_pos stands in for pygame.mouse.get_pos, following the scripted mouse events.
+    """
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+        self.index = 0
+        self.pos = (0, 0)
+
+    def __call__(self):
+        if self.index >= len(self.frames):
+            # script ran out, shut everything down
+            return [pygame.event.Event(pygame.QUIT)]
+        events = self.frames[self.index]
+        self.index += 1
+        for event in events:
+            if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN):
+                self.pos = event.pos
+        return events
+
+    def mouse_pos(self):
+        return self.pos
+
+
+def mouse_motion(x, y):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+
+
+def mouse_click(x, y):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1)
+
+
+def key_press(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+def menu_frames(button_y):
+    """Hover over the menu buttons, then click the one at button_y."""
+    x = menu.WIDTH // 2
+    frames = []
+    for i in range(MENU_FRAMES):
+        frames.append([mouse_motion(x, 150 + (i * 10) % 300)])
+    frames.append([mouse_click(x, button_y + menu.button_height // 2)])
+    return frames
+
+
+def game_frames(steps):
+    """Frames for one recorded game: hover toward each column, then click it."""
+    y = ui.HEADER_HEIGHT + ui.SQUARESIZE // 2
+    frames = []
+    for step in steps:
+        if isinstance(step, str):
+            frames.append([key_press(DIFFICULTY_KEYS[step][0])])
+            continue
+        target_x = step * ui.SQUARESIZE + ui.SQUARESIZE // 2
+        for i in range(IDLE_FRAMES):
+            frames.append([mouse_motion(target_x * (i + 1) // IDLE_FRAMES, y)])
+        frames.append([mouse_click(target_x, y)])
+    return frames
+
+
+def build_script(games):
+    """Menu -> Medium -> every recorded game -> Menu button -> Exit."""
+    frames = menu_frames(230)   # MEDIUM button
+    for steps in games:
+        frames += game_frames(steps)
+    frames.append([mouse_click(ui.WIDTH - 70, 27)])   # Menu button (top right)
+    frames += menu_frames(390)  # Exit button
+    return frames
+
+
+def check_games(games, depth=MEDIUM_DEPTH):
+    """
+    Make sure each recording is legal and ends on its last click, so replays stay in sync.
+    Returns the number of AI moves the replay should make.
+    """
+    ai_moves = 0
+    for number, steps in enumerate(games, 1):
+        board = create_board()
+        clicks = [step for step in steps if not isinstance(step, str)]
+        over = False
+        for step in steps:
+            if isinstance(step, str):
+                depth = DIFFICULTY_KEYS[step][1]
+                continue
+            if over or not is_valid_location(board, step):
+                raise ValueError(f"game {number}: illegal or extra click on column {step}")
+            drop_piece(board, get_next_open_row(board, step), step, PLAYER)
+            if check_winner(board, PLAYER) or len(get_valid_locations(board)) == 0:
+                over = True
+                continue
+            # search directly, get_ai_move would fill the cache and the replay would never search
+            col, _ = ai.search(board, depth)
+            drop_piece(board, get_next_open_row(board, col), col, AI)
+            ai_moves += 1
+            if check_winner(board, AI) or len(get_valid_locations(board)) == 0:
+                over = True
+        if not over:
+            raise ValueError(f"game {number}: not finished after {len(clicks)} clicks")
+    return ai_moves
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def print_report(frame_stats, ponder):
+    print(f"\nPondering: {'on' if ponder else 'off'}")
+    print(f"\n{'(ms)':<12}{'count':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}")
+    for name in ("menu_frame", "frame", "render", "draw_board", "ai_stall"):
+        times = frame_stats[name]
+        if not times:
+            continue
+        row = [percentile(times, pct) * 1000 for pct in (50, 90, 99)] + [max(times) * 1000]
+        print(f"{name:<12}{len(times):>7}" + "".join(f"{value:>9.3f}" for value in row))
+
+    frames = frame_stats["frame"]
+    over_budget = sum(1 for t in frames if t > FRAME_BUDGET)
+    print(f"\nGame frames over the 60 FPS budget: {over_budget}/{len(frames)}")
+    print(f"Frame loop stalled by AI search: {sum(frame_stats['ai_stall']):.3f} seconds total")
+
+
+def run_benchmark(games=GAMES, ponder=False):
+    """
+    Replay the recorded games through main_menu/run_ui and collect frame timings.
+    Pondering is off by default so the render timings aren't mixed with a
+    background thread competing for the GIL.
+    """
+    ai_moves = check_games(games)
+
+    # start cold, so ai_stall measures real searches
+    ai.search_cache.clear()
+
+    # no artificial pauses, the replay only measures real work
+    ui.AI_DELAY_MS = 0
+    ui.RESULT_DELAY_MS = 0
+
+    frame_stats = {name: [] for name in ("menu_frame", "frame", "render", "draw_board", "ai_stall")}
+    events = ScriptedEvents(build_script(games))
+
+    # the game loop prints every move, keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        menu.main_menu(get_events=events, frame_stats=frame_stats, ponder=ponder,
+                       get_mouse_pos=events.mouse_pos)
+
+    if events.index < len(events.frames):
+        raise RuntimeError("UI exited before the script finished")
+    if len(frame_stats["ai_stall"]) != ai_moves:
+        raise RuntimeError(f"replay made {len(frame_stats['ai_stall'])} AI moves, expected {ai_moves}")
+    return frame_stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless UI benchmark that replays recorded games.")
+    parser.add_argument("--max-render-ms", type=float, default=None,
+                        help="exit with an error if p99 render time is above this")
+    parser.add_argument("--ponder", action="store_true",
+                        help="replay with pondering on (render timings get noisier)")
+    args = parser.parse_args()
+
+    frame_stats = run_benchmark(ponder=args.ponder)
+    print_report(frame_stats, args.ponder)
+
+    if args.max_render_ms is not None:
+        p99 = percentile(frame_stats["render"], 99) * 1000
+        if p99 > args.max_render_ms:
+            print(f"FAIL: p99 render time {p99:.3f} ms is above {args.max_render_ms} ms")
+            sys.exit(1)